@@ -263,6 +263,7 @@ ENTRIES = [
     CE("proximity_call_node_text_color_plt", QColor, QColor(0x8B, 0x00, 0x8B)),
     CE("proximity_call_node_text_color_simproc", QColor, QColor(0x8B, 0x00, 0x8B)),
     CE("log_timestamp_format", str, "%X"),
+    CE("log_max_records", int, 100000),
     # FLIRT signatures
     CE("flirt_signatures_root", str, "./flirt_signatures/"),
     # Library documentation
@@ -20,7 +20,7 @@ from angrmanagement.logic.debugger import DebuggerListManager, DebuggerManager
 from angrmanagement.logic.threads import gui_thread_schedule, gui_thread_schedule_async
 from angrmanagement.utils.daemon_thread import start_daemon_thread
 
-from .log import LogRecord, initialize
+from .log import LogStore, initialize
 from .object_container import ObjectContainer
 
 if TYPE_CHECKING:
@@ -42,7 +42,7 @@ class Instance:
     project: ObjectContainer
     cfg: angr.analyses.cfg.CFGBase | ObjectContainer
     cfb: angr.analyses.cfg.CFBlanket | ObjectContainer
-    log: list[LogRecord] | ObjectContainer
+    log: LogStore | ObjectContainer
 
     def __init__(self) -> None:
         # pylint:disable=import-outside-toplevel
@@ -85,7 +85,7 @@ class Instance:
             list[type[ProtocolInteractor]],
             "Available interaction protocols",
         )
-        self.register_container("log", list, list[LogRecord], "Saved log messages", logging_permitted=False)
+        self.register_container("log", LogStore, LogStore, "Saved log messages", logging_permitted=False)
         self.register_container("current_trace", lambda: None, type[Trace], "Currently selected trace")
         self.register_container("traces", list, list[Trace], "Global traces list")
 
@@ -1,40 +1,75 @@
 from __future__ import annotations
 
 import atexit
+import copy
+import functools
 import logging
+import os
+import threading
+import time
+from array import array
+from collections import deque
 from datetime import datetime
 from logging.handlers import QueueHandler, QueueListener
 from multiprocessing import Queue
+from queue import SimpleQueue
 from typing import TYPE_CHECKING
 
 from angr.utils.mp import Initializer
 
 from angrmanagement.config import Conf
+from angrmanagement.logic.threads import gui_thread_schedule_async
 
 if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Iterator
+
     from angrmanagement.data.instance import Instance
 
 
-class LogTimeStamp:
+def _compile_timestamp_format(fmt: str) -> Callable[[float], str]:
     """
-    A Log timestamp with formatting
+    Build a callable which formats a unix timestamp with the given strftime format.
+    Formats without %f can go through time.strftime directly, which avoids allocating a datetime per call.
     """
+    if "%f" in fmt:
+        return lambda unix_timestamp: datetime.fromtimestamp(unix_timestamp).strftime(fmt)
+    return lambda unix_timestamp: time.strftime(fmt, time.localtime(unix_timestamp))
 
-    def __init__(self, unix_timestamp: int) -> None:
-        """
-        :param unix_time: The unix time the timestamp represents
-        """
-        self._ts = datetime.fromtimestamp(unix_timestamp)
-        self._cache_key: str | None = None
-        self._cache_str: str | None = None
 
-    def __str__(self) -> str:
-        """
-        Return the timestamp as a formatted string
-        """
-        if Conf.log_timestamp_format != self._cache_key:
-            self._cache_str = self._ts.strftime(Conf.log_timestamp_format)
-        return self._cache_str
+# The most recently used format, its compiled formatter, and whether it shows sub-second precision; rebuilt only when
+# Conf.log_timestamp_format changes
+_FORMATTER: tuple[str | None, Callable[[float], str] | None, bool] = (None, None, False)
+
+
+def _get_timestamp_formatter(fmt: str) -> tuple[Callable[[float], str], bool]:
+    global _FORMATTER  # pylint:disable=global-statement
+    if _FORMATTER[0] != fmt:
+        _FORMATTER = (fmt, _compile_timestamp_format(fmt), "%f" in fmt)
+    return _FORMATTER[1], _FORMATTER[2]
+
+
+@functools.lru_cache(maxsize=4096)
+def _format_whole_seconds(unix_seconds: int, fmt: str) -> str:
+    """
+    Format a unix timestamp with a format that has no sub-second part. Log records tend to arrive in bursts sharing
+    the same second, so results are cached.
+    """
+    return _get_timestamp_formatter(fmt)[0](unix_seconds)
+
+
+def _format_timestamp(unix_timestamp: float, fmt: str) -> str:
+    """
+    Format a unix timestamp.
+    """
+    formatter, subsecond = _get_timestamp_formatter(fmt)
+    if subsecond:
+        # practically every record renders differently, so there is nothing to cache
+        return formatter(unix_timestamp)
+    return _format_whole_seconds(int(unix_timestamp), fmt)
+
+
+# Used to render tracebacks for handlers without a formatter, like logging.Handler.format does
+_DEFAULT_FORMATTER = logging.Formatter()
 
 
 class LogRecord:
@@ -44,31 +79,204 @@ class LogRecord:
 
     __slots__ = (
         "level",
-        "timestamp",
+        "unix_ts",
         "source",
-        "content",
+        "_content",
     )
 
-    def __init__(self, level, unix_timestamp, source, content) -> None:
-        self.timestamp = LogTimeStamp(unix_timestamp)
+    def __init__(self, level, unix_timestamp: float, source, content: str) -> None:
+        self.reset(level, unix_timestamp, source, content)
+
+    def reset(self, level, unix_timestamp: float, source, content: str) -> None:
+        """
+        Overwrite all fields, so that the object can be reused for another record.
+        """
+        self.unix_ts = unix_timestamp
         self.level = level
         self.source = source
-        self.content = content
+        self._content = content
+
+    @property
+    def content(self) -> str:
+        return self._content
+
+    @property
+    def timestamp(self) -> str:
+        """
+        The timestamp, formatted according to Conf.log_timestamp_format
+        """
+        return _format_timestamp(self.unix_ts, Conf.log_timestamp_format)
+
+
+class LogStore:
+    """
+    Stores log records column by column, so that reading one field of many records (as the log view does) does not
+    have to go through one Python object per record.
+
+    At most `max_records` records are kept. Once full, the columns are used as a ring buffer and each new record
+    replaces the oldest one.
+    """
+
+    __slots__ = (
+        "levels",
+        "unix_timestamps",
+        "sources",
+        "contents",
+        "max_records",
+        "_head",
+    )
+
+    def __init__(self, max_records: int | None = None) -> None:
+        self.levels = array("i")
+        self.unix_timestamps = array("d")
+        self.sources: list[str] = []
+        self.contents: list[str] = []
+        self.max_records: int = max(Conf.log_max_records if max_records is None else max_records, 1)
+        # Physical index of the oldest record
+        self._head: int = 0
+
+    def __len__(self) -> int:
+        return len(self.levels)
+
+    def __getitem__(self, idx: int) -> LogRecord:
+        idx = self._physical_index(idx)
+        return LogRecord(self.levels[idx], self.unix_timestamps[idx], self.sources[idx], self.contents[idx])
+
+    def __iter__(self) -> Iterator[LogRecord]:
+        for idx in range(len(self)):
+            yield self[idx]
+
+    def _physical_index(self, idx: int) -> int:
+        size = len(self.levels)
+        if idx < 0:
+            idx += size
+        if not 0 <= idx < size:
+            raise IndexError("log record index out of range")
+        return (self._head + idx) % size
+
+    def level(self, idx: int) -> int:
+        return self.levels[self._physical_index(idx)]
+
+    def source(self, idx: int) -> str:
+        return self.sources[self._physical_index(idx)]
+
+    def content(self, idx: int) -> str:
+        return self.contents[self._physical_index(idx)]
+
+    def timestamp(self, idx: int) -> str:
+        """
+        Get the timestamp of a record, formatted according to Conf.log_timestamp_format
+        """
+        return _format_timestamp(self.unix_timestamps[self._physical_index(idx)], Conf.log_timestamp_format)
+
+    def append(self, record: LogRecord) -> int:
+        """
+        Append a record.
+
+        :return: The number of records dropped to make room for it.
+        """
+        content = record.content
+        if len(self.levels) < self.max_records:
+            self.levels.append(record.level)
+            self.unix_timestamps.append(record.unix_ts)
+            self.sources.append(record.source)
+            self.contents.append(content)
+            return 0
+        idx = self._head
+        self.levels[idx] = record.level
+        self.unix_timestamps[idx] = record.unix_ts
+        self.sources[idx] = record.source
+        self.contents[idx] = content
+        self._head = (idx + 1) % len(self.levels)
+        return 1
+
+    def extend(self, records: Iterable[LogRecord]) -> int:
+        """
+        Append records.
+
+        :return: The number of records dropped to make room for them.
+        """
+        dropped = 0
+        for record in records:
+            dropped += self.append(record)
+        return dropped
+
+    def clear(self) -> None:
+        del self.levels[:]
+        del self.unix_timestamps[:]
+        self.sources.clear()
+        self.contents.clear()
+        self._head = 0
 
 
 class LogDumpHandler(logging.Handler):
     """
     Dumps log messages.
+
+    Records are buffered and handed to the instance in batches on the GUI thread, so a burst of log messages results
+    in a single am_event instead of one per record.
     """
 
+    # Maximum number of LogRecord objects kept around for reuse
+    FREELIST_SIZE = 1024
+
     def __init__(self, instance: Instance, level=logging.NOTSET) -> None:
         super().__init__(level=level)
         self.instance = instance
+        self._pending: deque[LogRecord] = deque()
+        self._pending_lock = threading.Lock()
+        # LogRecord objects whose fields have been copied into the log store and which can be reused
+        self._freelist: deque[LogRecord] = deque(maxlen=self.FREELIST_SIZE)
+
+    def _make_log_record(self, *args, **kwargs) -> LogRecord:
+        try:
+            log_record = self._freelist.pop()
+        except IndexError:
+            return LogRecord(*args, **kwargs)
+        log_record.reset(*args, **kwargs)
+        return log_record
+
+    def _content(self, record: logging.LogRecord) -> str:
+        """
+        Extract the content of a record. Only strings are kept, so that the logging.LogRecord (and any frames
+        referenced by its exc_info) can be released right away.
+        """
+        if self.formatter is not None:
+            return self.format(record)
+        # With the default "%(message)s" format, the content is the message followed by the traceback and the stack
+        message = record.getMessage()
+        details = []
+        if record.exc_info and not record.exc_text:
+            record.exc_text = _DEFAULT_FORMATTER.formatException(record.exc_info)
+        if record.exc_text:
+            details.append(record.exc_text)
+        if record.stack_info:
+            details.append(_DEFAULT_FORMATTER.formatStack(record.stack_info))
+        if details:
+            if message[-1:] != "\n":
+                message += "\n"
+            message += "\n".join(details)
+        return message
 
     def emit(self, record: logging.LogRecord) -> None:
-        log_record = LogRecord(record.levelno, record.created, record.name, self.format(record))
-        self.instance.log.append(log_record)
-        self.instance.log.am_event(log_record=log_record)
+        log_record = self._make_log_record(record.levelno, record.created, record.name, self._content(record))
+        with self._pending_lock:
+            self._pending.append(log_record)
+            # A flush is already scheduled unless this is the first record of the batch
+            schedule_flush = len(self._pending) == 1
+        if schedule_flush:
+            gui_thread_schedule_async(self._flush)
+
+    def _flush(self) -> None:
+        with self._pending_lock:
+            log_records = list(self._pending)
+            self._pending.clear()
+        if log_records:
+            dropped = self.instance.log.extend(log_records)
+            end = len(self.instance.log)
+            start = max(end - len(log_records), 0)
+            self._freelist.extend(log_records)
+            self.instance.log.am_event(start=start, end=end, dropped=dropped)
 
 
 class AMQueueHandler(QueueHandler):
@@ -77,26 +285,79 @@ class AMQueueHandler(QueueHandler):
     This allows checking isinstance to ensure the handler is what we desired
     """
 
+    @property
+    def queue(self) -> Queue | SimpleQueue:
+        return self._queue
+
+    @queue.setter
+    def queue(self, queue: Queue | SimpleQueue) -> None:
+        # Resolved once here rather than for every record
+        self._queue = queue
+        self._process_local = isinstance(queue, SimpleQueue)
+        self._put = queue.put_nowait
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        self._put(record)
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        if not self._process_local:
+            # The record will be pickled to cross a process boundary, so tracebacks must be rendered here
+            return super().prepare(record)
+        # Only interpolate the message in the emitting thread; rendering tracebacks and the final formatting are left
+        # to the LogDumpHandler, which runs on the listener thread
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
 
-def install_queue_handler(queue: Queue) -> None:
+
+# The process in which the queue handler has been installed. A forked child inherits both this and the parent's handler,
+# but not the parent's process-local queue, hence the pid.
+_installed_pid: int | None = None
+
+
+def install_queue_handler(queue: Queue | SimpleQueue) -> None:
     """
     Install a queue handler using the given queue
     This function should work for both fork and spawn modes of multiprocessing
-    Fork modes may already have the parent logger installed, spawn may not
+    Fork modes may already have the parent's handler installed, which is pointed at the given queue instead since the
+    parent's process-local queue is not shared with the child; spawn modes may not have any handler installed yet
+    Once installed in a process, later calls in that process leave the handler alone, so records keep going to the
+    first queue
     """
-    if not any(isinstance(i, AMQueueHandler) for i in logging.root.handlers):
-        logging.root.handlers.insert(0, AMQueueHandler(queue))
+    global _installed_pid  # pylint:disable=global-statement
+    pid = os.getpid()
+    if _installed_pid == pid:
+        return
+
+    with logging._lock:  # pylint:disable=protected-access
+        for handler in logging.root.handlers:
+            if isinstance(handler, AMQueueHandler):
+                handler.queue = queue
+                break
+        else:
+            logging.root.handlers.insert(0, AMQueueHandler(queue))
+    _installed_pid = pid
 
 
-def initialize(level=logging.NOTSET) -> None:
+def initialize(instance: Instance, level=logging.NOTSET) -> None:
     """
     Installs a LogDumpHandler and sets up forwarding from other processes to this one
+    Only the first instance in a process receives log records; later calls do nothing
     """
-    queue = Queue()
-    # Install queue handlers to the current process and all future subprocesses
-    Initializer.get().register(install_queue_handler, queue)
-    install_queue_handler(queue)
-    # Install a listener which forwards log records to the LogDumpHandler
-    listener = QueueListener(queue, LogDumpHandler(level))
-    atexit.register(listener.stop)
-    listener.start()
+    if _installed_pid == os.getpid():
+        return
+    # Records emitted in the current process never cross a process boundary, so they do not need to be pickled
+    local_queue = SimpleQueue()
+    install_queue_handler(local_queue)
+    # Install queue handlers to all future subprocesses: forked children inherit the handler pointed at local_queue,
+    # which nothing reads in the child, while spawned children start without any handler
+    mp_queue = Queue()
+    os.register_at_fork(after_in_child=functools.partial(install_queue_handler, mp_queue))
+    Initializer.get().register(install_queue_handler, mp_queue)
+    # Install listeners which forward log records to the LogDumpHandler
+    handler = LogDumpHandler(instance, level)
+    for queue in (local_queue, mp_queue):
+        listener = QueueListener(queue, handler)
+        atexit.register(listener.stop)
+        listener.start()
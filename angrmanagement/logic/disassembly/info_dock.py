@@ -135,10 +135,21 @@ class InfoDock(QObject):
 
         self._update_published_view_state()
 
-    def unselect_instruction(self, insn_addr) -> None:
-        if insn_addr in self.selected_insns:
+    def _remove_selected_instruction(self, insn_addr) -> bool:
+        """
+        Remove an instruction from the selection.
+
+        :return:    True if the instruction was selected, False otherwise.
+        """
+        try:
             self.selected_insns.remove(insn_addr)
-            self.selected_insns.am_event()
+        except KeyError:
+            return False
+        self.selected_insns.am_event()
+        return True
+
+    def unselect_instruction(self, insn_addr) -> None:
+        self._remove_selected_instruction(insn_addr)
         self._update_published_view_state()
 
     def unselect_all_instructions(self) -> None:
@@ -222,8 +233,8 @@ class InfoDock(QObject):
         :return:              None
         """
 
-        if insn_addr in self.selected_insns:
-            self.unselect_instruction(insn_addr)
+        if self._remove_selected_instruction(insn_addr):
+            self._update_published_view_state()
         else:
             self.select_instruction(insn_addr, unique=unique, insn_pos=insn_pos)
 
@@ -5,11 +5,13 @@ class JumpHistory:
     """
     A class to store the navigation history of a reversing session. Typically found at DisassemblyView._jump_history
     or CodeView.jump_history. Maintains a list of addresses through which the user can navigate forwards and backwards.
+    At most `max_length` addresses are kept; the oldest entries are dropped first.
     """
 
-    def __init__(self) -> None:
+    def __init__(self, max_length: int = 1024) -> None:
         self._history = []
         self._pos = -1
+        self._max_length = max_length
 
     @property
     def history(self):
@@ -30,11 +32,22 @@ class JumpHistory:
         return len(self._history)
 
     def jump_to(self, addr: int) -> None:
+        if 0 <= self._pos < len(self._history):
+            if self._history[self._pos] == addr:
+                # already there
+                return
+            if self._pos > 0 and self._history[self._pos - 1] == addr:
+                # jumping back to where we just came from (A -> B -> A); step back instead of growing the history
+                self._pos -= 1
+                return
+
         if self._pos != len(self._history) - 1:
             self.trim()
 
         if not self._history or self._history[-1] != addr:
             self._history.append(addr)
+            if len(self._history) > self._max_length:
+                del self._history[: len(self._history) - self._max_length]
             self._pos = len(self._history) - 1
 
     def record_address(self, addr: int) -> None:
@@ -44,7 +57,7 @@ class JumpHistory:
             self.jump_to(addr)
 
     def trim(self) -> None:
-        self._history = self._history[: self._pos + 1]
+        del self._history[self._pos + 1 :]
 
     def backtrack(self):
         if self._pos > 0:
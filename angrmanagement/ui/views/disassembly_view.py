@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import contextlib
 import functools
 import logging
 from collections import defaultdict
@@ -764,7 +765,7 @@ class DisassemblyView(SynchronizedFunctionView):
                     func.name = f"sub_{addr:x}"
             else:
                 if new_name == "":
-                    if addr in kb.labels:
+                    with contextlib.suppress(KeyError):
                         del kb.labels[addr]
                 else:
                     if addr in kb.labels:
@@ -800,7 +801,7 @@ class DisassemblyView(SynchronizedFunctionView):
     def fetch_qblock_annotations(self, qblock):
         addr_to_annotations = defaultdict(list)
         for annotations_ in self.workspace.plugins.build_qblock_annotations(qblock):
-            addr_to_annotations[annotations_.addr].append(annotations)
+            addr_to_annotations[annotations_.addr].append(annotations_)
         for addr in qblock.addr_to_insns:
             if addr in self.instance.project._sim_procedures:
                 hook_annotation = QHookAnnotation(addr)
@@ -975,6 +976,15 @@ class DisassemblyView(SynchronizedFunctionView):
     # Utils
     #
 
+    @staticmethod
+    def _single(addrs: ObjectContainer) -> int | None:
+        """
+        Get the only address in a selection set, or None if it does not hold exactly one.
+        """
+        if len(addrs.am_obj) != 1:
+            return None
+        return next(iter(addrs.am_obj))
+
     def _address_in_selection(self) -> tuple[str, int] | None:
         if self._insn_addr_on_context_menu is not None:
             return "insn", self._insn_addr_on_context_menu
@@ -982,20 +992,20 @@ class DisassemblyView(SynchronizedFunctionView):
             selected_operand: OperandDescriptor = next(iter(self.infodock.selected_operands.values()))
             if selected_operand.num_value is not None:
                 return "operand", selected_operand.num_value
-        if len(self.infodock.selected_insns) == 1:
-            return "insn", next(iter(self.infodock.selected_insns))
-        if len(self.infodock.selected_labels) == 1:
-            return "insn", next(iter(self.infodock.selected_labels))
+        addr = self._single(self.infodock.selected_insns)
+        if addr is None:
+            addr = self._single(self.infodock.selected_labels)
+        if addr is not None:
+            return "insn", addr
         return None
 
     def _instruction_address_in_selection(self) -> int | None:
         if self._insn_addr_on_context_menu is not None:
             return self._insn_addr_on_context_menu
-        if len(self.infodock.selected_insns) == 1:
-            return next(iter(self.infodock.selected_insns))
-        if len(self.infodock.selected_labels) == 1:
-            return next(iter(self.infodock.selected_labels))
-        return None
+        addr = self._single(self.infodock.selected_insns)
+        if addr is None:
+            addr = self._single(self.infodock.selected_labels)
+        return addr
 
     def _get_instruction_size(self, addr: int) -> int | None:
         kb = self.instance.project.kb
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import itertools
 from typing import TYPE_CHECKING
 
 from PySide6.QtCore import QMarginsF
@@ -16,6 +17,8 @@ from PySide6.QtWidgets import (
 from angrmanagement.config import Conf
 
 if TYPE_CHECKING:
+    from PySide6.QtCore import QRectF
+
     from angrmanagement.ui.views.disassembly_view import DisassemblyView
     from angrmanagement.ui.views.symexec_view import SymexecView
 
@@ -28,30 +31,63 @@ class QInstructionAnnotation(QGraphicsSimpleTextItem):
     It must have address prop to show at the right place.
     """
 
+    MARGIN = QMarginsF(3, 0, 3, 0)
+    RADIUS = 3
+
     background_color = None
     foreground_color = None
     addr = None
+    # Set to True in subclasses whose text is the same for every instance and never changes. Their widths are then
+    # measured once per font and shared.
+    static_text = False
+    _static_text_widths: dict[tuple[type, str], float] = {}
 
     @property
     def disasm_view(self) -> DisassemblyView:
         return self.parentItem().disasm_view
 
     @property
-    def symexec_view(self) -> SymexecView:
-        return self.parentItem().disasm_view.workspace.view_manager.first_view_in_category("symexec")
+    def symexec_view(self) -> SymexecView | None:
+        disasm_view = self.disasm_view
+        if disasm_view is None:
+            return None
+        return disasm_view.workspace.view_manager.first_view_in_category("symexec")
 
     def __init__(self, addr: int, text: str, *args, **kwargs) -> None:
         super().__init__(text, *args, **kwargs)
         self.addr = addr
+        # (margins, radius) -> (box, background path), so that paths are only rebuilt when the box changes
+        self._path_cache: dict[tuple[float, float, float, float, float], tuple[QRectF, QPainterPath]] = {}
         self.setBrush(QBrush(self.foreground_color))
         self.setFont(Conf.disasm_font)
 
-    def paint(self, painter, *args, **kwargs) -> None:
-        margin = QMarginsF(3, 0, 3, 0)
-        box = self.boundingRect().marginsAdded(margin)
+    def text_width(self) -> float:
+        """
+        Get the width of the annotation text.
+        """
+        # Measure the text itself; subclasses may grow boundingRect() (e.g. while hovered)
+        if not self.static_text:
+            return QGraphicsSimpleTextItem.boundingRect(self).width()
+        key = (type(self), self.font().key())
+        width = self._static_text_widths.get(key)
+        if width is None:
+            width = QGraphicsSimpleTextItem.boundingRect(self).width()
+            self._static_text_widths[key] = width
+        return width
+
+    def _background_path(self, margin: QMarginsF, radius: float) -> QPainterPath:
+        box = QGraphicsSimpleTextItem.boundingRect(self).marginsAdded(margin)
+        key = (margin.left(), margin.top(), margin.right(), margin.bottom(), radius)
+        cached = self._path_cache.get(key)
+        if cached is not None and cached[0] == box:
+            return cached[1]
         path = QPainterPath()
-        path.addRoundedRect(box, 3, 3)
-        painter.fillPath(path, self.background_color)
+        path.addRoundedRect(box, radius, radius)
+        self._path_cache[key] = (box, path)
+        return path
+
+    def paint(self, painter, *args, **kwargs) -> None:
+        painter.fillPath(self._background_path(self.MARGIN, self.RADIUS), self.background_color)
         super().paint(painter, *args, **kwargs)
 
 
@@ -60,30 +96,43 @@ class QStatsAnnotation(QInstructionAnnotation):
     Abstract Stats Annotation Class.
     """
 
+    HOVERED_MARGIN = QMarginsF(7, 5, 7, 5)
+    STATS_RADIUS = 5
+
+    hovered = False
+
     def __init__(self, addr: int, text: str, *args, **kwargs) -> None:
         super().__init__(addr, text, *args, **kwargs)
         self.setAcceptHoverEvents(True)
-        self.hovered = False
 
     def mousePressEvent(self, event) -> None:
         pass
 
     def hoverEnterEvent(self, event) -> None:  # pylint: disable=unused-argument
-        self.hovered = True
-        if self.disasm_view:
-            self.disasm_view.redraw_current_graph()
+        self._set_hovered(True)
 
     def hoverLeaveEvent(self, event) -> None:  # pylint: disable=unused-argument
-        self.hovered = False
-        if self.disasm_view:
-            self.disasm_view.redraw_current_graph()
+        self._set_hovered(False)
+
+    def _set_hovered(self, hovered: bool) -> None:
+        # Only this annotation (and the bounds of its container) change, so there is no need to redraw the graph
+        self.prepareGeometryChange()
+        parent = self.parentItem()
+        if parent is not None:
+            parent.prepareGeometryChange()
+        self.hovered = hovered
+        self.update()
+
+    def boundingRect(self):
+        rect = super().boundingRect()
+        if self.hovered:
+            # the hovered background extends beyond the text
+            rect = rect.marginsAdded(self.HOVERED_MARGIN)
+        return rect
 
     def paint(self, painter, *args, **kwargs) -> None:
-        margin = QMarginsF(7, 5, 7, 5) if self.hovered else QMarginsF(3, 0, 3, 0)
-        box = self.boundingRect().marginsAdded(margin)
-        path = QPainterPath()
-        path.addRoundedRect(box, 5, 5)
-        painter.fillPath(path, self.background_color)
+        margin = self.HOVERED_MARGIN if self.hovered else self.MARGIN
+        painter.fillPath(self._background_path(margin, self.STATS_RADIUS), self.background_color)
         super().paint(painter, *args, **kwargs)
 
 
@@ -154,6 +203,7 @@ class QHookAnnotation(QInstructionAnnotation):
 
     background_color = QColor(230, 230, 230)
     foreground_color = QColor(50, 50, 50)
+    static_text = True
 
     def __init__(self, addr: int, *args, **kwargs) -> None:
         super().__init__(addr, "hook", *args, **kwargs)
@@ -176,6 +226,7 @@ class QExploreAnnotation(QInstructionAnnotation):
     background_color = None
     foreground_color = QColor(230, 230, 230)
     text = None
+    static_text = True
 
     def __init__(self, addr: int, qsimgrs: QSimulationManagers, *args, **kwargs) -> None:
         super().__init__(addr, self.text, *args, **kwargs)
@@ -214,6 +265,7 @@ class QBreakAnnotation(QInstructionAnnotation):
     background_color = QColor(200, 10, 10)
     foreground_color = QColor(220, 220, 220)
     text = "break"
+    static_text = True
 
     def __init__(self, bp, *args, **kwargs) -> None:
         super().__init__(bp.addr, self.text, *args, **kwargs)
@@ -255,12 +307,19 @@ class QBlockAnnotations(QGraphicsItem):
         super().__init__(parent=parent)
         self.addr_to_annotations = addr_to_annotations
         self.disasm_view: DisassemblyView = disasm_view
+        # (width, offset from the right edge) of the annotations at each address, in the same order as
+        # addr_to_annotations
+        self._layout: dict[int, list[tuple[float, float]]] = {}
         max_width = 0
-        for _addr, annotations_ in self.addr_to_annotations.items():
-            width = sum(a.boundingRect().width() + self.PADDING for a in annotations_)
-            max_width = max(max_width, width)
-            for annotation in annotations:
+        for addr, annotations_ in self.addr_to_annotations.items():
+            for annotation in annotations_:
                 annotation.setParentItem(self)
+            widths = [annotation.text_width() for annotation in annotations_]
+            # offsets[i] is the total width (with padding) of the annotations before the i-th one; the last entry is
+            # the width of the whole row
+            offsets = list(itertools.accumulate((width + self.PADDING for width in widths), initial=0))
+            self._layout[addr] = list(zip(widths, offsets[:-1], strict=True))
+            max_width = max(max_width, offsets[-1])
         self.width = max_width
         self._init_widgets()
 
@@ -276,8 +335,6 @@ class QBlockAnnotations(QGraphicsItem):
     def _init_widgets(self) -> None:
         # Set the x positions of all the annotations. The y positions will be set later while laying out the
         # instructions
-        for _addr, annotations_ in self.addr_to_annotations.items():
-            x = self.width
-            for annotation in annotations_:
-                annotation.setX(x - annotation.boundingRect().width())
-                x -= annotation.boundingRect().width() + self.PADDING
+        for addr, annotations_ in self.addr_to_annotations.items():
+            for annotation, (width, offset) in zip(annotations_, self._layout[addr], strict=True):
+                annotation.setX(self.width - offset - width)
@@ -5,7 +5,7 @@ import logging
 import os
 from typing import TYPE_CHECKING, Any
 
-from PySide6.QtCore import QAbstractTableModel, Qt
+from PySide6.QtCore import QAbstractTableModel, QModelIndex, Qt
 from PySide6.QtGui import QClipboard, QCursor, QGuiApplication, QIcon, QKeySequence
 from PySide6.QtWidgets import QAbstractItemView, QTableView
 
@@ -16,7 +16,7 @@ from angrmanagement.ui.menus.log_menu import LogMenu
 if TYPE_CHECKING:
     import PySide6
 
-    from angrmanagement.data.log import LogRecord
+    from angrmanagement.data.log import LogStore
 
 
 class QLogIcons:
@@ -61,14 +61,45 @@ class QLogTableModel(QAbstractTableModel):
     def __init__(self, log_widget: QLogWidget = None) -> None:
         super().__init__()
         self._log_widget = log_widget
-        self._log: list[LogRecord] = []
+        self._log: LogStore | None = None
+        # Number of records in the store which have been announced to views
+        self._row_count: int = 0
 
     @property
-    def log(self) -> list[LogRecord]:
+    def log(self) -> LogStore | None:
         return self._log
 
+    def reload(self, log: LogStore) -> None:
+        self.beginResetModel()
+        self._log = log
+        self._row_count = len(log)
+        self.endResetModel()
+
+    def remove_rows(self, count: int) -> None:
+        """
+        Announce that the oldest `count` records have been dropped from the store.
+        """
+        count = min(count, self._row_count)
+        if count > 0:
+            self.beginRemoveRows(QModelIndex(), 0, count - 1)
+            self._row_count -= count
+            self.endRemoveRows()
+
+    def insert_rows(self, start: int, end: int) -> None:
+        """
+        Announce records [start, end) which have been appended to the store.
+        """
+        if start != self._row_count:
+            # out of sync with the store
+            self.reload(self._log)
+            return
+        if end > start:
+            self.beginInsertRows(QModelIndex(), start, end - 1)
+            self._row_count = end
+            self.endInsertRows()
+
     def rowCount(self, parent: PySide6.QtCore.QModelIndex = ...) -> int:
-        return len(self._log)
+        return self._row_count
 
     def columnCount(self, parent: PySide6.QtCore.QModelIndex = ...) -> int:
         return len(self.Headers)
@@ -84,41 +115,38 @@ class QLogTableModel(QAbstractTableModel):
         if not index.isValid():
             return None
         row = index.row()
-        if row >= len(self.log):
+        if row >= self._row_count:
             return None
-        log = self.log[row]
         col = index.column()
 
         if role == Qt.DisplayRole:
-            return self._get_column_text(log, col)
+            return self._get_column_text(self._log, row, col)
         elif role == Qt.DecorationRole and col == QLogTableModel.COL_ICON:
-            return self._get_column_icon(log)
+            return self._get_column_icon(self._log.level(row))
         elif role == Qt.TextAlignmentRole:
             return Qt.AlignTop | Qt.AlignLeft
 
         return None
 
     @staticmethod
-    def _get_column_text(log: LogRecord, col: int) -> Any:
-        mapping = {
-            QLogTableModel.COL_TIMESTAMP: lambda x: str(x.timestamp),
-            QLogTableModel.COL_SOURCE: lambda x: str(x.source),
-            QLogTableModel.COL_CONTENT: lambda x: str(x.content),
-        }
-        func = mapping.get(col)
-        if func is None:
-            return None
-        return func(log)
+    def _get_column_text(log: LogStore, row: int, col: int) -> Any:
+        if col == QLogTableModel.COL_TIMESTAMP:
+            return log.timestamp(row)
+        elif col == QLogTableModel.COL_SOURCE:
+            return str(log.source(row))
+        elif col == QLogTableModel.COL_CONTENT:
+            return str(log.content(row))
+        return None
 
     @staticmethod
-    def _get_column_icon(log: LogRecord) -> QIcon | None:
+    def _get_column_icon(level: int) -> QIcon | None:
         mapping = {
             1: QLogIcons.benchmark(),
             logging.WARNING: QLogIcons.warning(),
             logging.ERROR: QLogIcons.error(),
             logging.CRITICAL: QLogIcons.error(),
         }
-        return mapping.get(log.level, None)
+        return mapping.get(level)
 
     @staticmethod
     def level_to_text(loglevel: int) -> str:
@@ -165,6 +193,7 @@ class QLogWidget(QTableView):
 
         self.doubleClicked.connect(self._on_double_clicked)
 
+        self.model.reload(self.log_view.instance.log.am_obj)
         self.log_view.instance.log.am_subscribe(self._on_new_logrecord)
 
     #
@@ -172,7 +201,7 @@ class QLogWidget(QTableView):
     #
 
     def clear_log(self) -> None:
-        self.log_view.instance.log.am_obj = []
+        self.log_view.instance.log.clear()
         self.log_view.instance.log.am_event()
 
     def copy_selected(self) -> None:
@@ -221,22 +250,18 @@ class QLogWidget(QTableView):
     def contextMenuEvent(self, arg__1: PySide6.QtGui.QContextMenuEvent) -> None:
         self._context_menu.popup(QCursor.pos())
 
-    def _on_new_logrecord(self, log_record: LogRecord = None) -> None:
-        gui_thread_schedule_async(self._on_new_logrecord_core, (log_record,))
+    def _on_new_logrecord(self, start: int | None = None, end: int | None = None, dropped: int = 0) -> None:
+        gui_thread_schedule_async(self._on_new_logrecord_core, (start, end, dropped))
 
-    def _on_new_logrecord_core(self, log_record: LogRecord = None) -> None:
+    def _on_new_logrecord_core(self, start: int | None = None, end: int | None = None, dropped: int = 0) -> None:
         self._before_row_insert()
 
-        if log_record is None:
+        if start is None:
             # reload
-            self.model.layoutAboutToBeChanged.emit()
-            self.model._log = self.log_view.instance.log[::]
-            self.model.layoutChanged.emit()
+            self.model.reload(self.log_view.instance.log.am_obj)
         else:
-            log_records = len(self.model.log)
-            self.model.rowsAboutToBeInserted.emit(self, log_records, log_records)
-            self.model.log.append(log_record)
-            self.model.rowsInserted.emit(self, log_records, log_records)
+            self.model.remove_rows(dropped)
+            self.model.insert_rows(start, end)
 
         self._after_row_insert()
 
@@ -0,0 +1,64 @@
+# pylint:disable=no-self-use
+from __future__ import annotations
+
+import unittest
+
+from angrmanagement.logic.disassembly import JumpHistory
+
+
+class JumpHistoryTests(unittest.TestCase):
+    """
+    Test cases for JumpHistory
+    """
+
+    def test_jump_and_backtrack(self):
+        jh = JumpHistory()
+        jh.jump_to(0x1000)
+        jh.jump_to(0x2000)
+        jh.jump_to(0x3000)
+        assert jh.history == [0x1000, 0x2000, 0x3000]
+        assert jh.backtrack() == 0x2000
+        assert jh.backtrack() == 0x1000
+        assert jh.backtrack() == 0x1000
+        assert jh.forwardstep() == 0x2000
+
+    def test_jump_trims_forward_history(self):
+        jh = JumpHistory()
+        jh.jump_to(0x1000)
+        jh.jump_to(0x2000)
+        jh.jump_to(0x3000)
+        jh.backtrack()
+        jh.backtrack()
+        jh.jump_to(0x4000)
+        assert jh.history == [0x1000, 0x4000]
+        assert jh.pos == 1
+
+    def test_jump_to_current_keeps_forward_history(self):
+        jh = JumpHistory()
+        jh.jump_to(0x1000)
+        jh.jump_to(0x2000)
+        jh.backtrack()
+        jh.jump_to(0x1000)
+        assert jh.history == [0x1000, 0x2000]
+        assert jh.pos == 0
+
+    def test_jump_to_previous_steps_back(self):
+        jh = JumpHistory()
+        jh.jump_to(0x1000)
+        jh.jump_to(0x2000)
+        jh.jump_to(0x1000)
+        jh.jump_to(0x2000)
+        assert jh.history == [0x1000, 0x2000]
+        assert jh.pos == 1
+
+    def test_max_length(self):
+        jh = JumpHistory(max_length=4)
+        for addr in range(10):
+            jh.jump_to(addr)
+        assert jh.history == [6, 7, 8, 9]
+        assert jh.pos == 3
+        assert jh.current == 9
+
+
+if __name__ == "__main__":
+    unittest.main()
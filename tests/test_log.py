@@ -0,0 +1,54 @@
+# pylint:disable=no-self-use
+from __future__ import annotations
+
+import logging
+import multiprocessing
+import threading
+import unittest
+from unittest import mock
+
+from angrmanagement.data import log
+
+
+class _CollectingHandler(logging.Handler):
+    def __init__(self) -> None:
+        super().__init__()
+        self.records = []
+        self.received = threading.Event()
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.records.append(record)
+        self.received.set()
+
+
+def _log_in_child() -> None:
+    logging.getLogger("angrmanagement.test_log").warning("from child")
+
+
+@unittest.skipUnless("fork" in multiprocessing.get_all_start_methods(), "fork is not available on this platform")
+class LogForwardingTests(unittest.TestCase):
+    """
+    Test cases for forwarding log records from subprocesses
+    """
+
+    def test_forked_child(self):
+        collector = _CollectingHandler()
+        root_handlers = list(logging.root.handlers)
+        try:
+            with (
+                mock.patch.object(log, "_installed_pid", None),
+                mock.patch.object(log, "LogDumpHandler", lambda instance, level: collector),
+            ):
+                log.initialize(None)
+                process = multiprocessing.get_context("fork").Process(target=_log_in_child)
+                process.start()
+                process.join()
+            assert process.exitcode == 0
+            assert collector.received.wait(10)
+            assert [record.getMessage() for record in collector.records] == ["from child"]
+        finally:
+            logging.root.handlers[:] = root_handlers
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,102 @@
+# pylint:disable=no-self-use
+from __future__ import annotations
+
+import unittest
+
+from angrmanagement.config import Conf
+from angrmanagement.data.log import LogRecord, LogStore
+
+
+def _record(i: int) -> LogRecord:
+    return LogRecord(i, 1000 + i, f"source{i}", f"content{i}")
+
+
+class LogStoreTests(unittest.TestCase):
+    """
+    Test cases for LogStore
+    """
+
+    def test_append_below_capacity(self):
+        store = LogStore(max_records=4)
+        dropped = store.extend(_record(i) for i in range(3))
+        assert dropped == 0
+        assert len(store) == 3
+        assert [store.content(i) for i in range(3)] == ["content0", "content1", "content2"]
+        assert store.level(1) == 1
+        assert store.source(2) == "source2"
+
+    def test_wrap_around_order(self):
+        store = LogStore(max_records=3)
+        assert store.extend(_record(i) for i in range(3)) == 0
+        assert store.append(_record(3)) == 1
+        assert store.append(_record(4)) == 1
+        assert len(store) == 3
+        assert [r.level for r in store] == [2, 3, 4]
+        assert [r.unix_ts for r in store] == [1002, 1003, 1004]
+        assert [store.content(i) for i in range(3)] == ["content2", "content3", "content4"]
+
+    def test_extend_larger_than_capacity(self):
+        store = LogStore(max_records=3)
+        store.extend(_record(i) for i in range(2))
+        records = [_record(i) for i in range(2, 9)]
+        dropped = store.extend(records)
+        assert dropped == 6
+        assert len(store) == 3
+        assert [r.level for r in store] == [6, 7, 8]
+        # the range the log view is told about: rows which are still present from the new batch
+        end = len(store)
+        start = max(end - len(records), 0)
+        assert (start, end) == (0, 3)
+
+    def test_event_range_after_drop(self):
+        store = LogStore(max_records=4)
+        store.extend(_record(i) for i in range(4))
+        records = [_record(4), _record(5)]
+        dropped = store.extend(records)
+        end = len(store)
+        start = max(end - len(records), 0)
+        assert dropped == 2
+        # the 4 rows the view had, minus the dropped ones, are followed by the new range
+        assert 4 - dropped == start
+        assert (start, end) == (2, 4)
+        assert [store.content(i) for i in range(start, end)] == ["content4", "content5"]
+
+    def test_clear_after_wrapping(self):
+        store = LogStore(max_records=2)
+        store.extend(_record(i) for i in range(5))
+        store.clear()
+        assert len(store) == 0
+        assert list(store) == []
+        assert store.extend(_record(i) for i in range(10, 12)) == 0
+        assert [r.level for r in store] == [10, 11]
+        assert store.append(_record(12)) == 1
+        assert [r.level for r in store] == [11, 12]
+
+    def test_indices(self):
+        store = LogStore(max_records=3)
+        store.extend(_record(i) for i in range(5))
+        assert store[-1].level == 4
+        assert store[-3].level == 2
+        assert store.content(-2) == "content3"
+        with self.assertRaises(IndexError):
+            store[3]  # pylint:disable=pointless-statement
+        with self.assertRaises(IndexError):
+            store[-4]  # pylint:disable=pointless-statement
+        with self.assertRaises(IndexError):
+            LogStore(max_records=3).content(0)
+
+    def test_subsecond_timestamp(self):
+        store = LogStore(max_records=2)
+        store.append(LogRecord(20, 1700000000.25, "source", "content"))
+        old_format = Conf.log_timestamp_format
+        try:
+            Conf.log_timestamp_format = "%S.%f"
+            assert store.timestamp(0).endswith(".250000")
+            Conf.log_timestamp_format = "%S"
+            assert "." not in store.timestamp(0)
+        finally:
+            Conf.log_timestamp_format = old_format
+
+
+if __name__ == "__main__":
+    unittest.main()